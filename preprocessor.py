@@ -1,6 +1,8 @@
 import nltk
 from nltk.stem import WordNetLemmatizer
 
+from tokenizer_engines import get_tokenizer_engine
+
 # Ensure NLTK resources are available (download_resources.py should have been run)
 # nltk.download('punkt', quiet=True)
 # nltk.download('averaged_perceptron_tagger', quiet=True)
@@ -8,8 +10,13 @@ from nltk.stem import WordNetLemmatizer
 # nltk.download('omw-1.4', quiet=True) # For WordNet
 
 class TextPreprocessor:
-    def __init__(self):
+    def __init__(self, tokenizer_engine="fast"):
+        """
+        tokenizer_engine: "fast" (compiled-regex fast path with NLTK fallback), "nltk",
+                          or an object providing sent_tokenize(text) and word_tokenize(sentence).
+        """
         self.lemmatizer = WordNetLemmatizer()
+        self.tokenizer = get_tokenizer_engine(tokenizer_engine)
 
     def _get_wordnet_pos(self, treebank_tag):
         """Converts treebank POS tags to WordNet POS tags."""
@@ -34,11 +41,11 @@ class TextPreprocessor:
         if not text.strip():
             return [] # Return empty list for empty or whitespace-only input
 
-        sentences = nltk.sent_tokenize(text)
+        sentences = self.tokenizer.sent_tokenize(text)
         processed_sentences = []
 
         for sentence in sentences:
-            tokens = nltk.word_tokenize(sentence)
+            tokens = self.tokenizer.word_tokenize(sentence)
             pos_tags = nltk.pos_tag(tokens)
             
             sentence_data = []
@@ -0,0 +1,275 @@
+import re
+import sys
+import time
+
+import nltk
+
+# Tokenizer engines used by TextPreprocessor. Each engine exposes
+# sent_tokenize(text) and word_tokenize(sentence) with the same output
+# format as the NLTK functions of the same name.
+
+# Characters that NLTK's word tokenizer handles with context-dependent rules
+# (quotes), multi-character sequences it pads as a unit, words it splits via
+# the MacIntyre contraction list, apostrophes that are not a plain Treebank
+# clitic ('s, 'm, 'd, 'll, 're, 've, n't) ending a word, and terminators that
+# nltk.word_tokenize would treat as a sentence boundary candidate when it
+# re-runs Punkt on the sentence.
+_CLITIC_END = r"(?=\s|$|[;@#$%&?!*()\[\]{}<>]|[,:](?!\d)|\.[\])}> ]*\s*$)"
+_AMBIGUOUS_WORD_RE = re.compile(
+    r"[\"`«“‘„»”’]"
+    r"|--|\.\.|[,:][,:]"
+    r"|'(?!(?:[sSmMdD]|ll|LL|re|RE|ve|VE)" + _CLITIC_END +
+    r"|(?<=n')t" + _CLITIC_END +
+    r"|(?<=N')T" + _CLITIC_END + r")"
+    r"|(?i:\b(?:cannot|gimme|gonna|gotta|lemme|wanna))"
+    r"|[.?!](?=[)\";}\]*:@'({\[!?]|\s+\S)"
+)
+
+# Treebank tokens for spans that passed the ambiguity check: words (keeping
+# internal periods and ",5"/":30" style digit groups), clitics, and single
+# punctuation characters (including the sentence-final period).
+_WORD_TOKEN_RE = re.compile(
+    r"(?:(?!n't|N'T)[^\s.,:;@#$%&?!*()\[\]{}<>']"
+    r"|[,:](?=\d)"
+    r"|\.(?![\])}> ]*\s*$))+"
+    r"|n't|N'T|'(?:[sSmMdD]|ll|LL|re|RE|ve|VE)"
+    r"|\S"
+)
+
+# Sentence terminators followed by something other than a word character,
+# whitespace or the end of the text (quotes, brackets, ellipses, "?!", ...).
+_AMBIGUOUS_BOUNDARY_RE = re.compile(r"[.?!](?![\w\s]|$)")
+
+# Candidate sentence boundaries: a whitespace-delimited chunk ending in a
+# terminator, followed by whitespace and the next chunk.
+_BOUNDARY_RE = re.compile(r"(?P<word>\S*)(?P<end>[.?!])(?=\s+(?P<next>\S+))")
+# Whitespace other than string.whitespace (NBSP, thin space, ...). Punkt finds the
+# word before a boundary by scanning back to the last ASCII whitespace character,
+# so a chunk delimited by these belongs to a longer word in Punkt's view.
+_NON_ASCII_SPACE_RE = re.compile(r"[^\S \t\n\r\x0b\x0c]")
+_PLAIN_WORD_RE = re.compile(r"[^\W\d_]{2,}")
+_NEXT_WORD_RE = re.compile(r"[^\W\d_]+(?=[;:?!'\")\]}*@({\[]|,$|$)")
+
+
+class NLTKTokenizerEngine:
+    """Reference engine: NLTK's Punkt sentence splitter and Treebank word tokenizer."""
+
+    def __init__(self, language: str = "english"):
+        self.language = language
+
+    def sent_tokenize(self, text: str) -> list[str]:
+        return nltk.sent_tokenize(text, language=self.language)
+
+    def word_tokenize(self, sentence: str) -> list[str]:
+        return nltk.word_tokenize(sentence, language=self.language)
+
+
+class FastTokenizerEngine:
+    """
+    Compiled-regex segmenter and tokenizer producing NLTK-compatible output.
+    Plain prose is handled with a single regex pass; any span that NLTK treats
+    with context-dependent rules (quotes, abbreviations, initials, numbers
+    before a period, ellipses, ...) is delegated to NLTK unchanged.
+    """
+
+    def __init__(self, language: str = "english"):
+        self.language = language
+        self._punkt_params = None
+        # Number of spans/sentences handed to NLTK, for the equivalence harness
+        self.sent_fallbacks = 0
+        self.word_fallbacks = 0
+
+    def _get_punkt_params(self):
+        """Loads the Punkt model parameters (abbreviations, collocations) once."""
+        if self._punkt_params is None:
+            # NLTK has no public accessor for these, so this reads the private _params
+            # attribute of nltk.tokenize.PunktTokenizer (available since NLTK 3.8.2).
+            self._punkt_params = nltk.tokenize.PunktTokenizer(self.language)._params
+        return self._punkt_params
+
+    def _is_clean_break(self, match) -> bool:
+        """Whether Punkt would certainly split at this candidate boundary."""
+        if not match.group("next")[0].isalpha():
+            return False # Punkt may realign quotes/brackets into the previous sentence
+        if _AMBIGUOUS_BOUNDARY_RE.search(match.group()):
+            return False # Another candidate boundary in the same chunk changes Punkt's context
+        text = match.string
+        if (_NON_ASCII_SPACE_RE.search(text, match.end("end"), match.start("next"))
+                or (match.start() > 0 and _NON_ASCII_SPACE_RE.match(text, match.start() - 1))):
+            return False # Punkt would see this chunk as part of a neighbouring one
+        if match.group("end") != ".":
+            return True
+        word = match.group("word")
+        if not _PLAIN_WORD_RE.fullmatch(word):
+            return False # Initials, numbers, and dotted abbreviations need Punkt's heuristics
+        next_word = _NEXT_WORD_RE.match(match.group("next"))
+        if not next_word:
+            return False
+        params = self._get_punkt_params()
+        word_type = word.lower()
+        return (word_type not in params.abbrev_types
+                and (word_type, next_word.group().lower()) not in params.collocations)
+
+    def _segment_span(self, span: str, needs_nltk: bool) -> list[str]:
+        """Segments the text between two clean breaks, using NLTK only if it holds an ambiguous boundary."""
+        if needs_nltk or _AMBIGUOUS_BOUNDARY_RE.search(span):
+            self.sent_fallbacks += 1
+            return nltk.sent_tokenize(span, language=self.language)
+        span = span.rstrip()
+        return [span] if span else []
+
+    def sent_tokenize(self, text: str) -> list[str]:
+        """
+        Splits text at boundaries Punkt would certainly break at. Punkt decides each
+        boundary from the tokens on either side of it, so only the spans between
+        those breaks that contain an ambiguous boundary are passed to NLTK.
+        """
+        sentences = []
+        span_start = 0
+        needs_nltk = False
+        for match in _BOUNDARY_RE.finditer(text):
+            if not self._is_clean_break(match):
+                needs_nltk = True
+                continue
+            sentences.extend(self._segment_span(text[span_start:match.end()], needs_nltk))
+            span_start = match.start("next")
+            needs_nltk = False
+        sentences.extend(self._segment_span(text[span_start:], needs_nltk))
+        return sentences
+
+    def word_tokenize(self, sentence: str) -> list[str]:
+        if _AMBIGUOUS_WORD_RE.search(sentence):
+            self.word_fallbacks += 1
+            return nltk.word_tokenize(sentence, language=self.language)
+        return _WORD_TOKEN_RE.findall(sentence)
+
+
+TOKENIZER_ENGINES = {
+    "nltk": NLTKTokenizerEngine,
+    "fast": FastTokenizerEngine,
+}
+
+
+def get_tokenizer_engine(engine="fast", language: str = "english"):
+    """
+    Returns a tokenizer engine instance.
+    engine: A name from TOKENIZER_ENGINES, or an object providing
+            sent_tokenize(text) and word_tokenize(sentence).
+    """
+    if not isinstance(engine, str):
+        return engine
+    if engine not in TOKENIZER_ENGINES:
+        raise ValueError(f"Unknown tokenizer engine '{engine}'. Available engines: {', '.join(TOKENIZER_ENGINES)}.")
+    return TOKENIZER_ENGINES[engine](language=language)
+
+
+def tokenize_text(engine, text: str) -> list[list[str]]:
+    """Splits text into sentences and each sentence into tokens using the given engine."""
+    return [engine.word_tokenize(sentence) for sentence in engine.sent_tokenize(text)]
+
+
+def compare_engines(texts: list[str], reference=None, candidate=None) -> list[tuple[str, list, list]]:
+    """
+    Equivalence harness: tokenizes each text with both engines.
+    Returns a list of (text, reference_output, candidate_output) for every text where they differ.
+    """
+    reference = reference or NLTKTokenizerEngine()
+    candidate = candidate or FastTokenizerEngine()
+    mismatches = []
+    for text in texts:
+        expected = tokenize_text(reference, text)
+        actual = tokenize_text(candidate, text)
+        if expected != actual:
+            mismatches.append((text, expected, actual))
+    return mismatches
+
+
+def fast_path_coverage(texts: list[str], engine=None) -> dict[str, int]:
+    """
+    Reports how much of the input the fast engine handles without NLTK:
+    texts segmented without any NLTK fallback, and sentences tokenized by the regex path.
+    """
+    engine = engine or FastTokenizerEngine()
+    coverage = {"texts": len(texts), "fast_texts": 0, "sentences": 0, "fast_sentences": 0}
+    for text in texts:
+        sent_fallbacks = engine.sent_fallbacks
+        sentences = engine.sent_tokenize(text)
+        if engine.sent_fallbacks == sent_fallbacks:
+            coverage["fast_texts"] += 1
+        for sentence in sentences:
+            word_fallbacks = engine.word_fallbacks
+            engine.word_tokenize(sentence)
+            coverage["sentences"] += 1
+            if engine.word_fallbacks == word_fallbacks:
+                coverage["fast_sentences"] += 1
+    return coverage
+
+
+SAMPLE_CORPUS = [
+    # Typical prose
+    "This is an example sentence. AI models are running quickly and generating texts. The texts look good.",
+    "It's important to note that the results don't always hold. We'll see what they're saying!",
+    "Furthermore, the model achieved 93.5% accuracy on 1,200 samples: a significant improvement.",
+    "Is this really the best approach? Some researchers think so; others disagree (strongly).",
+    "In conclusion, leveraging AI can enhance productivity. However, it's crucial to consider ethics.",
+    "The results (see Table 2) were [mostly] positive; the {outliers} were <removed>.",
+    "First, gather data. Second, clean it. Third, train the model.",
+    "Email us at info@example.com or visit example.org/help for details.",
+    "The meeting starts at 10:30 and ends at 12:00. Don't be late!",
+    "We tested three models: small, medium and large. The large one won.",
+    "Costs fell by 12% year-over-year & margins improved #growth.",
+    "Naïve approaches fail. Über-complex ones fail too. Simple ones work.",
+    "  Leading whitespace is kept on the first sentence.\n\nTrailing whitespace is not.  \n",
+    "A single sentence without a final period",
+    "Why? Because it works! And it's cheap.",
+    # Clitics before commas, colons and a final period
+    "It's, as they say, what it's. We'll see: they're here, I'm sure. You'd know it's.",
+    "They've gone, haven't they? I'd say so: we're done, aren't we.",
+    "WE'LL SEE. IT'S FINE, ISN'T IT? THEY'RE HERE.",
+    # Abbreviations, initials, numbers and quotes handled by NLTK
+    "Mr. Smith went to Washington, D.C. on Jan. 5th. He arrived at 3 p.m. and left early.",
+    "She said, \"I can't believe it!\" Then she left... Nobody knew why.",
+    "The U.S. economy grew by 2.3% in 2023. Analysts expected more.",
+    "Prices rose from $3.88 to $4.10 -- a 5.6% jump -- over the quarter.",
+    "I cannot say. You gotta try it, and I'm gonna help. 'Tis the season.",
+    "Their dogs' toys were everywhere. Rock'n'roll never dies.",
+    "J. R. R. Tolkien wrote many books. He was born in 1892.",
+    "Wait... what? Really?! Yes.",
+    "He left (quietly.) Then he came back [again.] Nobody noticed.",
+    "See the appendix, e.g. the last table. It has everything.",
+    # Terminators that nltk.word_tokenize re-splits when it re-runs Punkt
+    "Stop.! Go now.",
+    "It ended.(See below) And then?",
+    "Look here.[1] More text follows.",
+    "The word was 'end'. Then silence.",
+    # Non-ASCII whitespace, which Punkt does not treat as a word separator
+    "Great job!\xa0Really!\xa0Thanks.",
+    "Is it done?\xa0Yes!\xa0Good.",
+    "Wait? \xa0No! \xa0Yes.",
+    "The model\u2009works. It\u3000scales well.\u2009Results vary.",
+]
+# A paragraph mixing clean and ambiguous boundaries, as passed by TextHumanizer
+SAMPLE_CORPUS.append(" ".join(SAMPLE_CORPUS))
+
+
+if __name__ == '__main__':
+    # Equivalence check against NLTK on the sample corpus
+    mismatches = compare_engines(SAMPLE_CORPUS)
+    print(f"Compared {len(SAMPLE_CORPUS)} texts: {len(mismatches)} mismatches.")
+    for text, expected, actual in mismatches:
+        print(f"\nText: {text}\n  nltk: {expected}\n  fast: {actual}")
+
+    coverage = fast_path_coverage(SAMPLE_CORPUS)
+    print(f"Fast path: {coverage['fast_texts']}/{coverage['texts']} texts segmented without NLTK, "
+          f"{coverage['fast_sentences']}/{coverage['sentences']} sentences tokenized without NLTK.")
+
+    # Rough timing comparison
+    for name in TOKENIZER_ENGINES:
+        engine = get_tokenizer_engine(name)
+        start_time = time.perf_counter()
+        for _ in range(200):
+            for text in SAMPLE_CORPUS:
+                tokenize_text(engine, text)
+        print(f"{name}: {time.perf_counter() - start_time:.3f}s")
+
+    sys.exit(1 if mismatches else 0)